@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-from collections import defaultdict
 from pathlib import Path
 from typing import Dict
 
@@ -13,8 +12,7 @@ from divaspmerger import (
     plan_resolutions,
     print_conflict_details,
     export_report,
-    detect_id_conflicts,
-    detect_song_conflicts,
+    detect_conflicts,
     discover_pvdb_files,
     collect_pack_and_songs,
 )
@@ -77,15 +75,17 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
     args = parse_args()
     game_root = args.game.expanduser().resolve()
+    config_path = args.config_path.expanduser()
+    backup_dir = args.backup_dir.expanduser()
     if not game_root.exists():
         raise SystemExit(f"Game path {game_root} does not exist.")
 
     mod_config_path = game_root.parent / "config.toml"
     priority_lookup, mods_root = load_mod_config(mod_config_path)
-    ignore_mods, exempt_mods = load_program_config(args.config_path.expanduser())
+    ignore_mods, exempt_mods = load_program_config(config_path)
     
-    pack_infos: Dict[str, PackInfo] = defaultdict()
-    pvdb_files = discover_pvdb_files(mods_root)
+    pack_infos: Dict[str, PackInfo] = {}
+    pvdb_files = discover_pvdb_files(mods_root, ignore_mods=ignore_mods)
     
     if not pvdb_files:
         log_warn("No pv_db files found under the provided mods directory.")
@@ -95,7 +95,7 @@ def main() -> None:
     if args.restore_backup:
         log_info("Restoring backup files before proceeding...")
         for mod_name, pvdb_path in pvdb_files:
-            restore_backup(args.backup_dir.expanduser(), pvdb_path, no_exist_ok=True)
+            restore_backup(backup_dir, pvdb_path, no_exist_ok=True)
     
     pack_infos, mod_entries = collect_pack_and_songs(
         mod_root=mods_root,
@@ -113,8 +113,7 @@ def main() -> None:
         log_info(f"{mod_name}: {pack_info.num_songs} songs", indent=2)
     log_info(f"Total songs indexed: {len(mod_entries)}")
 
-    id_conflicts = detect_id_conflicts(mod_entries)
-    song_conflicts = detect_song_conflicts(mod_entries)
+    id_conflicts, song_conflicts = detect_conflicts(mod_entries)
     
     if args.verbose_conflict:
         print_conflict_details(id_conflicts, song_conflicts)
@@ -135,7 +134,7 @@ def main() -> None:
         
     if plans and not args.restore_backup:
         log_info(f"Prepared {len(plans)} resolution plan(s). Starting execution...")
-        apply_resolution_plans(plans, backup_dir=args.backup_dir.expanduser(), 
+        apply_resolution_plans(plans, backup_dir=backup_dir,
                                dry_run=args.dry_run, exempt_mods=exempt_mods)
 
 
@@ -1,6 +1,7 @@
 """Core package for DIVASP Merger tooling."""
 
 from .conflict_detector import (
+    detect_conflicts,
     detect_id_conflicts,
     detect_song_conflicts,
     discover_pvdb_files,
@@ -23,6 +24,7 @@ __all__ = [
     "load_mod_config",
     "discover_pvdb_files",
     "parse_pvdb_file",
+    "detect_conflicts",
     "detect_id_conflicts",
     "detect_song_conflicts",
     "collect_pack_and_songs",
@@ -1,32 +1,47 @@
 from __future__ import annotations
 
+import mmap
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Iterable, List
 
 from .logging_utils import log_info
 from .models import PackInfo, SongEntry
-from .text_utils import COMMENT_PATTERN, PV_KEY_PATTERN
+from . import text_utils
 
 DEFAULT_PRIORITY = 9999
 
 
-def discover_pvdb_files(mods_root: Path) -> List[tuple[str, Path]]:
+def discover_pvdb_files(
+	mods_root: Path,
+	ignore_mods: List[str] | None = None,
+) -> List[tuple[str, Path]]:
 	"""Return every mod pv_db file found under the provided mods directory."""
 
+	ignore_lookup = set(ignore_mods or ())
 	files: List[tuple[str, Path]] = []
-	for mod_dir in mods_root.iterdir():
-		if not mod_dir.is_dir():
+	with os.scandir(mods_root) as mod_iter:
+		mod_dirs = [(entry.name, entry.path) for entry in mod_iter if entry.is_dir()]
+	for mod_name, mod_path in mod_dirs:
+		if mod_name in ignore_lookup:
+			log_info(f"Skipping ignored mod: {mod_name}")
 			continue
-		mod_name = mod_dir.name
-		for path in mod_dir.rglob("*.txt"):
-			if not path.is_file():
-				continue
-			if path.parent.name != "rom":
+		stack = [mod_path]
+		while stack:
+			current = stack.pop()
+			try:
+				with os.scandir(current) as dir_iter:
+					entries = list(dir_iter)
+			except OSError:
 				continue
-			if path.name.lower() != "mod_pv_db.txt":
-				continue
-			files.append((mod_name, path))
+			in_rom = os.path.basename(current) == "rom"
+			for entry in entries:
+				if entry.is_dir(follow_symlinks=False):
+					stack.append(entry.path)
+				elif in_rom and entry.name.lower() == "mod_pv_db.txt" and entry.is_file():
+					files.append((mod_name, Path(entry.path)))
 	return files
 
 
@@ -36,38 +51,32 @@ def parse_pvdb_file(
 ) -> List[SongEntry]:
 	"""Parse a mod's pv_db text file into song entries and pack metadata."""
 
-	song_data: Dict[int, Dict[str, str]] = defaultdict(dict)
-	with pvdb_path.open("r", encoding="utf-8", errors="ignore") as handle:
-		for raw_line in handle:
-			line = raw_line.strip()
-			if not line:
-				continue
-			match = COMMENT_PATTERN.match(line)
-			if match:
-				pv_id = int(match.group(1))
-				song_data[pv_id]["comment_title"] = match.group(2).strip()
-				continue
-			if line.startswith("#"):
-				continue
-			if "=" not in line:
-				continue
-			key, value = line.split("=", 1)
-			key = key.strip()
-			value = value.strip()
-			key_match = PV_KEY_PATTERN.match(key)
-			if not key_match:
-				continue
-			pv_id = int(key_match.group(1))
-			attr = key_match.group(2).lower()
-			if attr == "song_name":
-				song_data[pv_id]["song_name"] = value
-			elif attr == "song_name_en":
-				song_data[pv_id]["song_name_en"] = value
+	song_names: Dict[int, str] = {}
+	song_names_en: Dict[int, str] = {}
+	comment_titles: Dict[int, str] = {}
+	with pvdb_path.open("rb") as handle:
+		try:
+			data: mmap.mmap | bytes = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+		except (ValueError, OSError):  # empty file or filesystem without mmap support
+			data = handle.read()
+		try:
+			for match in text_utils.PVDB_LINE_PATTERN.finditer(data):
+				# The bytes pattern only trims ASCII blanks; strip again after
+				# decoding so Unicode whitespace (e.g. full-width spaces) goes too.
+				if match.group(1) is not None:
+					comment_titles[int(match.group(1))] = match.group(2).decode("utf-8", "ignore").strip()
+				elif match.group(4).lower() == b"song_name":
+					song_names[int(match.group(3))] = match.group(5).decode("utf-8", "ignore").strip()
+				else:
+					song_names_en[int(match.group(3))] = match.group(5).decode("utf-8", "ignore").strip()
+		finally:
+			if isinstance(data, mmap.mmap):
+				data.close()
 
 	song_entries = []
-	for pv_id, data in song_data.items():
-		primary = data.get("song_name") or data.get("comment_title")
-		secondary = data.get("song_name_en")
+	for pv_id in song_names.keys() | comment_titles.keys() | song_names_en.keys():
+		primary = song_names.get(pv_id) or comment_titles.get(pv_id)
+		secondary = song_names_en.get(pv_id)
 		title = primary or secondary
 		if not title:
 			continue
@@ -84,6 +93,13 @@ def parse_pvdb_file(
 	return song_entries
 
 
+def _parse_one(target: tuple[str, Path]) -> tuple[str, Path, List[SongEntry]]:
+	"""Parse a single (mod_name, pvdb_path) pair; module-level so it pickles."""
+
+	mod_name, pvdb_path = target
+	return mod_name, pvdb_path, parse_pvdb_file(pvdb_path, mod_name)
+
+
 def collect_pack_and_songs(
 	mod_root: Path,
 	pvdb_files: List[tuple[str, Path]],
@@ -92,22 +108,36 @@ def collect_pack_and_songs(
 ) -> tuple[Dict[str, PackInfo], List[SongEntry]]:
 	"""Construct PackInfo objects for each mod based on their pv_db files."""
 
-	packs: Dict[str, PackInfo] = defaultdict()
+	packs: Dict[str, PackInfo] = {}
 	all_songs: List[SongEntry] = []
+	seen_paths: Dict[str, Path] = {}
+	duplicates: List[str] = []
+	targets: List[tuple[str, Path]] = []
 	for mod_name, pvdb_path in pvdb_files:
 		if ignore_mods and mod_name in ignore_mods:
 			log_info(f"Skipping ignored mod: {mod_name}")
 			continue
 
-		if mod_name in packs:
-			raise SystemExit(
-				f"Duplicate mod name detected: {mod_name}. Please check two 'pvdb' files."
-				f"One: {packs[mod_name].pvdb_path}, Other: {pvdb_path}."
-				f"It may because of pvdb file discover rule not Complete and find a wrong pvdb file."
-				f"Please remove one of them as a temporary workaround."
-			)
+		if mod_name in seen_paths:
+			duplicates.append(f"{mod_name} (One: {seen_paths[mod_name]}, Other: {pvdb_path})")
+			continue
+		seen_paths[mod_name] = pvdb_path
+		targets.append((mod_name, pvdb_path))
+
+	if duplicates:
+		raise SystemExit(
+			f"Duplicate mod name(s) detected: {'; '.join(duplicates)}. Please check the 'pvdb' files."
+			f"It may because of pvdb file discover rule not Complete and find a wrong pvdb file."
+			f"Please remove one of them as a temporary workaround."
+		)
+
+	if len(targets) > 4:
+		with ProcessPoolExecutor() as executor:
+			parsed_files = list(executor.map(_parse_one, targets, chunksize=4))
+	else:
+		parsed_files = [_parse_one(target) for target in targets]
 
-		parsed_songs = parse_pvdb_file(pvdb_path, mod_name)
+	for mod_name, pvdb_path, parsed_songs in parsed_files:
 		priority = (
 			priority_lookup.get(mod_name, DEFAULT_PRIORITY)
 			if priority_lookup
@@ -130,38 +160,66 @@ def detect_id_conflicts(entries: Iterable[SongEntry]) -> Dict[int, List[SongEntr
 	"""Group entries that share the same PV ID across different sources."""
 
 	grouped: Dict[int, List[SongEntry]] = defaultdict(list)
+	first_source: Dict[int, tuple[str, str]] = {}
+	conflict_keys: set[int] = set()
 	for entry in entries:
 		grouped[entry.pv_id].append(entry)
+		source = entry.source_key
+		if first_source.setdefault(entry.pv_id, source) != source:
+			conflict_keys.add(entry.pv_id)
 
-	conflicts: Dict[int, List[SongEntry]] = {}
-	for pv_id, group in grouped.items():
-		sources = {(item.source_type, item.source_name) for item in group}
-		if len(sources) > 1:
-			conflicts[pv_id] = group
-	return conflicts
+	return {pv_id: group for pv_id, group in grouped.items() if pv_id in conflict_keys}
 
 
 def detect_song_conflicts(entries: Iterable[SongEntry]) -> Dict[str, List[SongEntry]]:
 	"""Group entries that resolve to the same normalized title across sources."""
 
 	grouped: Dict[str, List[SongEntry]] = defaultdict(list)
+	first_source: Dict[str, tuple[str, str]] = {}
+	conflict_keys: set[str] = set()
 	for entry in entries:
 		key = entry.normalized_title
 		if not key:
 			continue
 		grouped[key].append(entry)
+		source = entry.source_key
+		if first_source.setdefault(key, source) != source:
+			conflict_keys.add(key)
+
+	return {title: group for title, group in grouped.items() if title in conflict_keys}
+
+
+def detect_conflicts(
+	entries: Iterable[SongEntry],
+) -> tuple[Dict[int, List[SongEntry]], Dict[str, List[SongEntry]]]:
+	"""Detect PV ID and song title conflicts in a single pass over entries."""
+
+	id_grouped: Dict[int, List[SongEntry]] = defaultdict(list)
+	title_grouped: Dict[str, List[SongEntry]] = defaultdict(list)
+	id_first: Dict[int, tuple[str, str]] = {}
+	title_first: Dict[str, tuple[str, str]] = {}
+	id_keys: set[int] = set()
+	title_keys: set[str] = set()
+	for entry in entries:
+		source = entry.source_key
+		id_grouped[entry.pv_id].append(entry)
+		if id_first.setdefault(entry.pv_id, source) != source:
+			id_keys.add(entry.pv_id)
+		title = entry.normalized_title
+		if title:
+			title_grouped[title].append(entry)
+			if title_first.setdefault(title, source) != source:
+				title_keys.add(title)
 
-	conflicts: Dict[str, List[SongEntry]] = {}
-	for normalized_title, group in grouped.items():
-		sources = {(item.source_type, item.source_name) for item in group}
-		if len(sources) > 1:
-			conflicts[normalized_title] = group
-	return conflicts
+	id_conflicts = {pv_id: group for pv_id, group in id_grouped.items() if pv_id in id_keys}
+	song_conflicts = {title: group for title, group in title_grouped.items() if title in title_keys}
+	return id_conflicts, song_conflicts
 
 
 __all__ = [
 	"discover_pvdb_files",
 	"parse_pvdb_file",
+	"detect_conflicts",
 	"detect_id_conflicts",
 	"detect_song_conflicts",
 	"collect_pack_and_songs",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 
@@ -9,6 +10,30 @@ def ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def _fast_copy(source: Path, destination: Path) -> None:
+    """Copy source to destination, staying in-kernel when the OS allows it."""
+
+    with source.open("rb") as src, destination.open("wb") as dst:
+        copied = False
+        if hasattr(os, "copy_file_range"):
+            try:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    moved = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if moved == 0:
+                        break
+                    remaining -= moved
+                copied = remaining == 0
+            except OSError:
+                copied = False
+        if not copied:
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+            shutil.copyfileobj(src, dst, 1 << 20)
+    shutil.copystat(source, destination)
+
+
 def backup_file(source: Path, backup_dir: Path) -> Path:
     if not source.exists():
         raise FileNotFoundError(f"Cannot backup missing file: {source}")
@@ -16,7 +41,7 @@ def backup_file(source: Path, backup_dir: Path) -> Path:
     mod_name = source.parent.parent.name
     destination = backup_dir / (mod_name + "_" + source.name + ".bak")
     if not destination.exists():
-        shutil.copy2(source, destination)
+        _fast_copy(source, destination)
         log_info(f"Created backup: {destination}")
     else:
         log_info(f"Backup already exists: {destination}")
@@ -32,7 +57,7 @@ def restore_backup(
         if no_exist_ok:
             return
         raise FileNotFoundError(f"Cannot restore missing backup: {backup_path}")
-    shutil.copy2(backup_path, target_path)
+    _fast_copy(backup_path, target_path)
     log_info(f"Restored backup from {backup_path} to {target_path}")
 
 
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import toml
+import tomllib
 from pathlib import Path
 from typing import Dict, List
 
 from .logging_utils import log_warn
 
+_mod_config_cache: Dict[tuple[str, int], tuple[Dict[str, int], Path]] = {}
+_program_config_cache: Dict[tuple[str, int], tuple[List[str], List[str]]] = {}
+
 
 def load_mod_config(mod_config_path: Path) -> tuple[Dict[str, int], Path]:
     """Load mod priority information from a JSON file.
@@ -21,10 +24,15 @@ def load_mod_config(mod_config_path: Path) -> tuple[Dict[str, int], Path]:
         log_warn(f"Load-order file {mod_config_path} not found. Proceeding without priorities.")
         return priorities, mod_config_path.parent / 'mods'
 
-    raw_text = mod_config_path.read_text(encoding="utf-8")
+    cache_key = (str(mod_config_path), mod_config_path.stat().st_mtime_ns)
+    cached = _mod_config_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        config = toml.loads(raw_text)
-    except toml.TomlDecodeError as exc:
+        with mod_config_path.open("rb") as handle:
+            config = tomllib.load(handle)
+    except tomllib.TOMLDecodeError as exc:
         raise ValueError(f"Invalid TOML in load-order file: {mod_config_path}") from exc
 
     mods_root_dir = mod_config_path.parent / config['mods']
@@ -33,7 +41,8 @@ def load_mod_config(mod_config_path: Path) -> tuple[Dict[str, int], Path]:
     
     for pri, name in enumerate(mod_priorities_list):
         priorities[name] = pri
-        
+
+    _mod_config_cache[cache_key] = (priorities, mods_root_dir)
     return priorities, mods_root_dir
 
 
@@ -51,13 +60,20 @@ def load_program_config(config_path: Path) -> tuple[List[str], List[str]]:
     if not config_path.exists():
         log_warn(f"Load-order file {config_path} not found. Proceeding without priorities.")
         return ignore_mods, exempt_mods
-    raw_text = config_path.read_text(encoding="utf-8")
+
+    cache_key = (str(config_path), config_path.stat().st_mtime_ns)
+    cached = _program_config_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        config = toml.loads(raw_text)
-    except toml.TomlDecodeError as exc:
+        with config_path.open("rb") as handle:
+            config = tomllib.load(handle)
+    except tomllib.TOMLDecodeError as exc:
         raise ValueError(f"Invalid TOML in load-order file: {config_path}") from exc
 
     ignore_mods = config["ignore_mods"]
     exempt_mods = config["exempt_mods"]
 
+    _program_config_cache[cache_key] = (ignore_mods, exempt_mods)
     return ignore_mods, exempt_mods
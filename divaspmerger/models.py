@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -12,7 +13,7 @@ class ConflictType(str, Enum):
     SONG = "song_conflict"
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False)
 class SongEntry:
     pv_id: int
     title: str
@@ -20,15 +21,32 @@ class SongEntry:
     source_name: str
     source_type: str
     pvdb_path: Path
-
-    @property
-    def normalized_title(self) -> str:
-        reference = self.title_en or ""
-        return normalize_title(reference)
-
-    @property
-    def source_label(self) -> str:
-        return f"{self.source_type}:{self.source_name}"
+    normalized_title: str = field(init=False)
+    source_key: tuple[str, str] = field(init=False)
+    source_label: str = field(init=False)
+    pvdb_path_str: str = field(init=False, repr=False)
+    display_title: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.source_name = sys.intern(self.source_name)
+        self.source_type = sys.intern(self.source_type)
+        self.normalized_title = sys.intern(normalize_title(self.title_en or ""))
+        self.display_title = self.title_en or self.title or ""
+        self.source_key = (self.source_type, self.source_name)
+        self.source_label = f"{self.source_type}:{self.source_name}"
+        self.pvdb_path_str = str(self.pvdb_path) if self.pvdb_path else ""
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SongEntry):
+            return NotImplemented
+        return (
+            self.pv_id == other.pv_id
+            and self.source_name == other.source_name
+            and self.pvdb_path == other.pvdb_path
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.pv_id, self.source_name, self.pvdb_path))
 
 
 @dataclass(slots=True)
@@ -38,16 +56,21 @@ class PackInfo:
     location: Path
     pvdb_path: Path
     songs: List[SongEntry] = field(default_factory=list)
+    _song_index: set[SongEntry] = field(default_factory=set, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._song_index = set(self.songs)
 
     def add_song(self, song: SongEntry) -> None:
-        self.songs.append(song)
-        
+        if song not in self._song_index:
+            self._song_index.add(song)
+            self.songs.append(song)
+
     def merge(self, other: "PackInfo") -> None:
         assert self.name == other.name, "Can only merge packs with the same name"
         assert self.pvdb_path == other.pvdb_path, "Can only merge packs with the same pvdb_path"
         for song in other.songs:
-            if song not in self.songs:
-                self.songs.append(song)
+            self.add_song(song)
     
     @property
     def song_ids(self) -> List[int]:
@@ -65,9 +88,12 @@ class ConflictRecord:
     entries: List[SongEntry]
     winner: SongEntry
     losers: List[SongEntry] = field(default_factory=list)
+    _involved_mods: tuple[str, ...] | None = field(default=None, init=False, repr=False, compare=False)
 
     def involved_mods(self) -> Sequence[str]:
-        return sorted({entry.source_name for entry in self.entries})
+        if self._involved_mods is None:
+            self._involved_mods = tuple(sorted({entry.source_name for entry in self.entries}))
+        return self._involved_mods
 
     def losers_by_mod(self) -> dict[str, List[SongEntry]]:
         grouping: dict[str, List[SongEntry]] = {}
@@ -81,12 +107,22 @@ class ResolutionPlan:
     mod_name: str
     pvdb_file: Path
     pv_ids_to_remove: List[int] = field(default_factory=list)
-    
+    _ids_seen: set[int] = field(default_factory=set, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._ids_seen = set(self.pv_ids_to_remove)
+
     @property
     def total_removals(self) -> int:
         return len(self.pv_ids_to_remove)
 
+    def add_removal(self, pv_id: int) -> None:
+        if pv_id not in self._ids_seen:
+            self._ids_seen.add(pv_id)
+            self.pv_ids_to_remove.append(pv_id)
+
     def merge(self, other: "ResolutionPlan") -> None:
         assert self.mod_name == other.mod_name, "Can only merge plans for the same mod"
         assert self.pvdb_file == other.pvdb_file, "Can only merge plans with the same pvdb_file"
-        self.pv_ids_to_remove.extend(pid for pid in other.pv_ids_to_remove if pid not in self.pv_ids_to_remove)
+        for pv_id in other.pv_ids_to_remove:
+            self.add_removal(pv_id)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from itertools import combinations
+import heapq
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, Iterator, List, Sequence
 
 from openpyxl import Workbook
 
@@ -35,63 +36,77 @@ def print_conflict_details(
 
 
 def _format_song_names(group: Sequence[SongEntry]) -> str:
-    names = [entry.title_en or entry.title for entry in group if entry.title_en or entry.title]
+    names = {entry.display_title for entry in group if entry.display_title}
     if not names:
         return ""
-    return ", ".join(sorted(set(names)))
+    return ", ".join(sorted(names))
 
 
 def _format_sources(group: Sequence[SongEntry]) -> str:
     return ", ".join(sorted({entry.source_label for entry in group}))
 
 
+def _iter_sorted_entries(entries: List[SongEntry]) -> Iterator[SongEntry]:
+    """Yield entries in songs-sheet order by merging short per-source runs.
+
+    Entries arrive grouped by mod already, so sorting each run by pv_id and
+    heap-merging the runs replaces one big N log N sort over every entry.
+    """
+
+    runs: Dict[tuple[str, str], List[SongEntry]] = defaultdict(list)
+    for entry in entries:
+        runs[entry.source_key].append(entry)
+    for run in runs.values():
+        run.sort(key=lambda item: item.pv_id)
+    return heapq.merge(
+        *runs.values(),
+        key=lambda item: (item.source_type, item.source_name, item.pv_id),
+    )
+
+
 def _build_conflict_rows(
     conflicts: List[ConflictRecord],
-) -> List[List[str]]:
-    rows: List[List[str]] = []
+) -> Iterator[tuple[str, ...]]:
     for conflict in conflicts:
         if conflict.conflict_type == ConflictType.ID:
             pv_ids = str(conflict.winner.pv_id)
             song_names = _format_song_names(conflict.entries)
         elif conflict.conflict_type == ConflictType.SONG:
-            pv_ids = ", ".join(str(entry.pv_id) for entry in conflict.entries)
-            song_names = conflict.winner.title_en or conflict.winner.title
+            pv_ids = ", ".join(map(str, dict.fromkeys(entry.pv_id for entry in conflict.entries)))
+            song_names = conflict.winner.display_title
         else:
-            pv_ids = ", ".join(str(entry.pv_id) for entry in conflict.entries)
+            pv_ids = ", ".join(map(str, dict.fromkeys(entry.pv_id for entry in conflict.entries)))
             song_names = _format_song_names(conflict.entries)
-        row = [
+        yield (
             conflict.conflict_type.value,  # conflict_type
             song_names,                     # song_names
             pv_ids,                         # pv_ids
             conflict.winner.source_label,  # picked_source
             _format_sources(conflict.entries),  # sources
-        ]
-        rows.append(row)
-    return rows
+        )
 
 
 def _build_pack_conflict_rows(
     conflicts: List[ConflictRecord],
     pack_infos: Dict[str, PackInfo],
     plans: Dict[str, ResolutionPlan],
-) -> List[List[Any]]:
-    
-    conflict_partners: Dict[str, set[str]] = {}
-    conflict_ids: Dict[str, set[int]] = {}
+) -> Iterator[tuple[Any, ...]]:
+
+    conflict_groups: Dict[str, List[Sequence[str]]] = defaultdict(list)
+    conflict_ids: Dict[str, set[int]] = defaultdict(set)
     for conflict in conflicts:
         involved_mods = conflict.involved_mods()
-        for mod_a, mod_b in combinations(involved_mods, 2):
-            conflict_partners.setdefault(mod_a, set()).add(mod_b)
-            conflict_partners.setdefault(mod_b, set()).add(mod_a)
         for mod in involved_mods:
-            conflict_ids.setdefault(mod, set()).add(conflict.winner.pv_id)
-    
-    rows: List[List[Any]] = []
+            conflict_groups[mod].append(involved_mods)
+            conflict_ids[mod].add(conflict.winner.pv_id)
+
+    rows: List[tuple[Any, ...]] = []
     for pack_name, pack_info in pack_infos.items():
         plan = plans.get(pack_name)
-        conflict_partner = conflict_partners.get(pack_name, [])
+        groups = conflict_groups.get(pack_name)
+        conflict_partner = sorted(set().union(*groups) - {pack_name}) if groups else []
         removal_songs = plan.total_removals if plan else 0
-        row = [
+        row = (
             pack_info.priority,  # priority
             pack_name,  # pack_name
             pack_info.num_songs,  # total_songs
@@ -99,9 +114,9 @@ def _build_pack_conflict_rows(
             removal_songs,  # removal_songs
             pack_info.num_songs - removal_songs,  # remain_songs
             ", ".join(conflict_partner),  # conflict_partners
-        ]
+        )
         rows.append(row)
-    return sorted(rows, key=lambda r: (r[0], r[1]))  # Sort by priority, then pack_name
+    yield from sorted(rows, key=lambda r: (r[0], r[1]))  # Sort by priority, then pack_name
 
 
 def export_report(
@@ -115,44 +130,42 @@ def export_report(
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    workbook = Workbook()
-    
+    workbook = Workbook(write_only=True)
+
     # Export Song info sheet
-    songs_sheet = workbook.active
-    if not songs_sheet:
-        songs_sheet = workbook.create_sheet("songs")
-    else:
-        songs_sheet.title = "songs"
-    songs_sheet.append([
+    songs_sheet = workbook.create_sheet("songs")
+    songs_sheet.append((
         "pv id",
         "title",
         "title en",
         "source type",
         "source name",
         "pvdb path",
-    ])
-    for entry in sorted(entries, key=lambda item: (item.source_type, item.source_name, item.pv_id)):
-        songs_sheet.append(
-            [
-                entry.pv_id,
-                entry.title,
-                entry.title_en or "",
-                entry.source_type,
-                entry.source_name,
-                str(entry.pvdb_path) if entry.pvdb_path else "",
-            ]
+    ))
+    song_rows = (
+        (
+            entry.pv_id,
+            entry.title,
+            entry.title_en or "",
+            entry.source_type,
+            entry.source_name,
+            entry.pvdb_path_str,
         )
+        for entry in _iter_sorted_entries(entries)
+    )
+    for row in song_rows:
+        songs_sheet.append(row)
 
     # Export Conflicts sheet
     conflicts_sheet = workbook.create_sheet("conflicts")
-    conflicts_sheet.append(["conflict type", "song name", "pv ids", "picked source", "all sources"])
+    conflicts_sheet.append(("conflict type", "song name", "pv ids", "picked source", "all sources"))
     for row in _build_conflict_rows(conflicts=conflicts):
         conflicts_sheet.append(row)
 
     # Export Pack Conflicts sheet
     pack_sheet = workbook.create_sheet("pack_conflicts")
     pack_sheet.append(
-        [
+        (
             "priority",
             "pack name",
             "total songs",
@@ -160,13 +173,12 @@ def export_report(
             "removal songs",
             "remain songs",
             "conflict partners",
-        ]
+        )
     )
     for row in _build_pack_conflict_rows(conflicts=conflicts, pack_infos=pack_infos, plans=plans):
         pack_sheet.append(row)
 
     workbook.save(output_path)
-    workbook.close()
 
 
 __all__ = ["print_conflict_details", "export_report"]
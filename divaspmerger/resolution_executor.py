@@ -1,29 +1,29 @@
 from __future__ import annotations
 
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Sequence, Set
+from typing import Dict, List, Sequence, Set
 
 from .file_utils import backup_file
 from .models import ResolutionPlan
-from .text_utils import PV_KEY_PATTERN
-from .logging_utils import log_info, log_warn, log_error
+from . import text_utils
+from .logging_utils import log, log_info
 
-def _extract_pv_id(line: str) -> int | None:
-    stripped = line.strip()
-    if not stripped or stripped.startswith("#") or "=" not in stripped:
-        return None
-    key_part = stripped.split("=", 1)[0].strip()
-    match = PV_KEY_PATTERN.match(key_part)
+def _extract_pv_id(line: bytes) -> int | None:
+    match = text_utils.PV_LINE_BYTES_PATTERN.match(line)
     if not match:
         return None
     return int(match.group(1))
 
 
-def _comment_line(line: str) -> str:
-    indent_len = len(line) - len(line.lstrip(" \t"))
+def _comment_line(line: bytes) -> bytes:
+    indent_len = len(line) - len(line.lstrip(b" \t"))
     prefix = line[:indent_len]
     remainder = line[indent_len:]
-    return f"{prefix}#@DIVASPMerger {remainder}"
+    return prefix + b"#@DIVASPMerger " + remainder
 
 
 def _comment_out_pv_entries(pvdb_file: Path, target_ids: Sequence[int]) -> tuple[int, Set[int]]:
@@ -31,27 +31,88 @@ def _comment_out_pv_entries(pvdb_file: Path, target_ids: Sequence[int]) -> tuple
     if not target_lookup:
         return 0, set()
 
-    with pvdb_file.open("r", encoding="utf-8", errors="ignore") as reader:
-        lines = reader.readlines()
-
     changes = 0
     affected_ids: Set[int] = set()
-    for idx, line in enumerate(lines):
-        pv_id = _extract_pv_id(line)
-        if pv_id is None or pv_id not in target_lookup:
-            continue
-        updated_line = _comment_line(line)
-        lines[idx] = updated_line
-        affected_ids.add(pv_id)
-        changes += 1
+    with pvdb_file.open("rb") as reader, tempfile.NamedTemporaryFile(
+        dir=pvdb_file.parent, prefix=pvdb_file.name + ".", delete=False
+    ) as writer:
+        temp_path = writer.name
+        try:
+            for line in reader:
+                if line.lstrip()[:3].lower() == b"pv_":
+                    pv_id = _extract_pv_id(line)
+                    if pv_id is not None and pv_id in target_lookup:
+                        line = _comment_line(line)
+                        affected_ids.add(pv_id)
+                        changes += 1
+                writer.write(line)
+            # NamedTemporaryFile is created 0600; carry over the original
+            # permissions so os.replace does not change the file's mode.
+            shutil.copymode(pvdb_file, temp_path)
+        except OSError:
+            os.unlink(temp_path)
+            raise
 
     if changes:
-        with pvdb_file.open("w", encoding="utf-8", newline="") as writer:
-            writer.writelines(lines)
+        os.replace(temp_path, pvdb_file)
+    else:
+        os.unlink(temp_path)
 
     return changes, affected_ids
 
 
+def _apply_one(
+    mod_name: str,
+    plan: ResolutionPlan,
+    backup_dir: Path,
+    dry_run: bool,
+    exemptions: Set[str],
+) -> List[tuple[str, str, int]]:
+    """Resolve one mod's plan, returning (level, message, indent) log records."""
+
+    messages: List[tuple[str, str, int]] = [("info", f"Resolving conflicts for mod '{mod_name}'", 0)]
+    if mod_name.lower() in exemptions:
+        messages.append(("info", "Skipped: mod is exempt from automatic fixes via config.", 2))
+        return messages
+
+    if not plan.pvdb_file.exists():
+        messages.append(("warn", f"Skipped: pv_db file '{plan.pvdb_file}' not found.", 2))
+        return messages
+
+    if not plan.pv_ids_to_remove:
+        messages.append(("info", "No conflicting PV IDs to remove.", 2))
+        return messages
+
+    target_list = ", ".join(str(pid) for pid in sorted(plan.pv_ids_to_remove))
+    messages.append(("info", f"Target PV IDs: {target_list}", 2))
+
+    if dry_run:
+        messages.append(("info", "Dry run active. No file changes were made.", 2))
+        return messages
+
+    backup_file(plan.pvdb_file, backup_dir)
+
+    try:
+        line_changes, affected_ids = _comment_out_pv_entries(plan.pvdb_file, plan.pv_ids_to_remove)
+    except OSError as exc:
+        messages.append(("error", f"Error while editing pv_db: {exc}", 2))
+        return messages
+
+    if affected_ids:
+        affected_msg = ", ".join(str(pid) for pid in sorted(affected_ids))
+        messages.append(("info", f"Commented definitions for PV IDs: {affected_msg}", 2))
+    else:
+        messages.append(("warn", "No matching PV definitions were found to comment out.", 2))
+
+    missing_ids = sorted(set(plan.pv_ids_to_remove) - affected_ids)
+    if missing_ids:
+        missing_msg = ", ".join(str(pid) for pid in missing_ids)
+        messages.append(("warn", f"Missing PV definitions for: {missing_msg}", 2))
+
+    messages.append(("info", f"Total lines updated: {line_changes}", 2))
+    return messages
+
+
 def apply_resolution_plans(
     plans: Dict[str, ResolutionPlan],
     backup_dir: Path,
@@ -64,47 +125,14 @@ def apply_resolution_plans(
 
     exemptions = {mod_name.lower() for mod_name in (exempt_mods or [])}
 
-    for mod_name, plan in plans.items():
-        log_info(f"Resolving conflicts for mod '{mod_name}'")
-        if mod_name.lower() in exemptions:
-            log_info("Skipped: mod is exempt from automatic fixes via config.", indent=2)
-            continue
-
-        if not plan.pvdb_file.exists():
-            log_warn(f"Skipped: pv_db file '{plan.pvdb_file}' not found.", indent=2)
-            continue
-
-        if not plan.pv_ids_to_remove:
-            log_info("No conflicting PV IDs to remove.", indent=2)
-            continue
-
-        target_list = ", ".join(str(pid) for pid in sorted(plan.pv_ids_to_remove))
-        log_info(f"Target PV IDs: {target_list}", indent=2)
-
-        if dry_run:
-            log_info("Dry run active. No file changes were made.", indent=2)
-            continue
-        
-        backup_file(plan.pvdb_file, backup_dir)
-
-        try:
-            line_changes, affected_ids = _comment_out_pv_entries(plan.pvdb_file, plan.pv_ids_to_remove)
-        except OSError as exc:
-            log_error(f"Error while editing pv_db: {exc}", indent=2)
-            continue
-
-        if affected_ids:
-            affected_msg = ", ".join(str(pid) for pid in sorted(affected_ids))
-            log_info(f"Commented definitions for PV IDs: {affected_msg}", indent=2)
-        else:
-            log_warn("No matching PV definitions were found to comment out.", indent=2)
-
-        missing_ids = sorted(set(plan.pv_ids_to_remove) - affected_ids)
-        if missing_ids:
-            missing_msg = ", ".join(str(pid) for pid in missing_ids)
-            log_warn(f"Missing PV definitions for: {missing_msg}", indent=2)
-
-        log_info(f"Total lines updated: {line_changes}", indent=2)
+    with ThreadPoolExecutor(max_workers=min(8, len(plans))) as executor:
+        futures = [
+            executor.submit(_apply_one, mod_name, plan, backup_dir, dry_run, exemptions)
+            for mod_name, plan in plans.items()
+        ]
+        for future in futures:
+            for level, message, indent in future.result():
+                log(message, level, indent)
 
 
 
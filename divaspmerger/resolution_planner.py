@@ -7,17 +7,15 @@ from .models import ConflictRecord, ConflictType, PackInfo, ResolutionPlan, Song
 DEFAULT_LOW_PRIORITY = 9999
 
 
-def _entry_priority(entry: SongEntry, pack_infos: Dict[str, PackInfo]) -> int:
-    pack = pack_infos.get(entry.source_name)
-    if pack:
-        return pack.priority
-    return DEFAULT_LOW_PRIORITY
-
-
-def _select_winner(entries: Iterable[SongEntry], pack_infos: Dict[str, PackInfo]) -> tuple[SongEntry, List[SongEntry]]:
-    sorted_entries = sorted(entries, key=lambda e: (_entry_priority(e, pack_infos), e.source_name))
-    winner = sorted_entries[0]
-    losers = sorted_entries[1:]
+def _select_winner(
+    entries: Iterable[SongEntry], priority_by_name: Dict[str, int]
+) -> tuple[SongEntry, List[SongEntry]]:
+    entries = list(entries)
+    winner = min(
+        entries,
+        key=lambda e: (priority_by_name.get(e.source_name, DEFAULT_LOW_PRIORITY), e.source_name),
+    )
+    losers = [entry for entry in entries if entry is not winner]
     return winner, losers
 
 
@@ -27,8 +25,9 @@ def build_conflict_records(
     pack_infos: Dict[str, PackInfo],
 ) -> List[ConflictRecord]:
     records: List[ConflictRecord] = []
+    priority_by_name = {name: pack.priority for name, pack in pack_infos.items()}
     for pv_id, group in id_conflicts.items():
-        winner, losers = _select_winner(group, pack_infos)
+        winner, losers = _select_winner(group, priority_by_name)
         records.append(
             ConflictRecord(
                 conflict_type=ConflictType.ID,
@@ -40,7 +39,7 @@ def build_conflict_records(
         )
 
     for normalized_title, group in song_conflicts.items():
-        winner, losers = _select_winner(group, pack_infos)
+        winner, losers = _select_winner(group, priority_by_name)
         records.append(
             ConflictRecord(
                 conflict_type=ConflictType.SONG,
@@ -63,6 +62,5 @@ def plan_resolutions(conflicts: Iterable[ConflictRecord]) -> Dict[str, Resolutio
                 loser.source_name,
                 ResolutionPlan(mod_name=loser.source_name, pvdb_file=loser.pvdb_path),
             )
-            if loser.pv_id not in plan.pv_ids_to_remove:
-                plan.pv_ids_to_remove.append(loser.pv_id)
+            plan.add_removal(loser.pv_id)
     return plans
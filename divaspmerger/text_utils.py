@@ -1,11 +1,34 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
-WHITESPACE_PATTERN = re.compile(r"\s+")
-PV_KEY_PATTERN = re.compile(r"^pv_(\d+)\.(.+)$", re.IGNORECASE)
-COMMENT_PATTERN = re.compile(r"^#\s*(\d+)\s*-\s*(.+)$")
+_PATTERN_SPECS: dict[str, tuple[str | bytes, int]] = {
+    "PV_KEY_PATTERN": (r"^pv_(\d+)\.(.+)$", re.IGNORECASE),
+    "PV_LINE_BYTES_PATTERN": (rb"^[ \t]*pv_(\d+)\.[^\s=#]+\s*=", re.IGNORECASE),
+    "COMMENT_PATTERN": (r"^#\s*(\d+)\s*-\s*(.+)$", 0),
+    # Interior whitespace must stay [ \t]: under MULTILINE a \s* would cross
+    # newlines and glue an empty-value line onto the one below it.
+    "PVDB_LINE_PATTERN": (
+        rb"^[ \t]*(?:#[ \t]*(\d+)[ \t]*-[ \t]*(.+?)|pv_(\d+)\.(song_name(?:_en)?)[ \t]*=[ \t]*(.+?))[ \t\r]*$",
+        re.IGNORECASE | re.MULTILINE,
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern(name: str) -> re.Pattern:
+    pattern, flags = _PATTERN_SPECS[name]
+    return re.compile(pattern, flags)
+
+
+def __getattr__(name: str) -> re.Pattern:
+    if name in _PATTERN_SPECS:
+        compiled = _compile_pattern(name)
+        globals()[name] = compiled
+        return compiled
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def normalize_title(raw: str) -> str:
-    return WHITESPACE_PATTERN.sub(" ", raw).strip().lower()
+    return " ".join(raw.split()).lower()